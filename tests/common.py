@@ -11,6 +11,7 @@ import logging
 from Crypto.PublicKey import RSA
 from Crypto.PublicKey.RSA import RsaKey
 import oss2
+from oss2.task_queue import TaskQueue
 
 logging.basicConfig(level=logging.DEBUG)
 
@@ -77,6 +78,10 @@ if OSS_TEST_BUCKET is None:
 else:
     OSS_BUCKET = OSS_TEST_BUCKET + random_string(10)
 
+# 使用pytest-xdist并发运行时，每个worker使用自己的bucket，避免用例之间相互影响（例如修改bucket ACL）
+if os.getenv('PYTEST_XDIST_WORKER'):
+    OSS_BUCKET = OSS_BUCKET + '-' + os.getenv('PYTEST_XDIST_WORKER')
+
 def random_bytes(n):
     return oss2.to_bytes(random_string(n))
 
@@ -136,6 +141,29 @@ def delete_keys(bucket, key_list):
         bucket.batch_delete_objects(g)
 
 
+def run_concurrently(func, items, num_threads=5):
+    """用最多num_threads个线程（不超过16）对items中的每个元素调用func，任何一次调用抛出的异常都会重新抛出。"""
+    def producer(q):
+        for item in items:
+            q.put(item)
+
+    def consumer(q):
+        while q.ok():
+            item = q.get()
+            if item is None:
+                break
+
+            func(item)
+
+    num_threads = max(1, min(num_threads, len(items), 16))
+    TaskQueue(producer, [consumer] * num_threads).run()
+
+
+def put_objects(bucket, key_list, content_func, num_threads=5):
+    """并发上传key_list中的文件，每个文件的内容由content_func(key)生成。"""
+    run_concurrently(lambda key: bucket.put_object(key, content_func(key)), key_list, num_threads)
+
+
 class NonlocalObject(object):
     def __init__(self, value):
         self.var = value
@@ -151,6 +179,9 @@ def wait_meta_sync():
 class OssTestCase(unittest.TestCase):
     SINGLE_THREAD_CASE = 'single thread case'
 
+    # 为True时，bucket由子类在setUpClass中创建并在tearDownClass中删除，各用例之间共享
+    SHARED_BUCKET = False
+
     def __init__(self, *args, **kwargs):
         super(OssTestCase, self).__init__(*args, **kwargs)
         self.bucket = None
@@ -175,10 +206,11 @@ class OssTestCase(unittest.TestCase):
 
         self.bucket = oss2.Bucket(oss2.make_auth(OSS_ID, OSS_SECRET, OSS_AUTH_VERSION), OSS_ENDPOINT, OSS_BUCKET)
 
-        try:
-            self.bucket.create_bucket()
-        except:
-            pass
+        if not self.SHARED_BUCKET:
+            try:
+                self.bucket.create_bucket()
+            except:
+                pass
 
         self.rsa_crypto_bucket = oss2.CryptoBucket(oss2.make_auth(OSS_ID, OSS_SECRET, OSS_AUTH_VERSION), OSS_ENDPOINT,
                                                    OSS_BUCKET, crypto_provider=oss2.RsaProvider(key_pair))
@@ -194,8 +226,9 @@ class OssTestCase(unittest.TestCase):
         for temp_file in self.temp_files:
             oss2.utils.silently_remove(temp_file)
 
-        clean_and_delete_bucket(self.bucket)
-        clean_and_delete_bucket_by_prefix(OSS_BUCKET + "-test-")
+        if not self.SHARED_BUCKET:
+            clean_and_delete_bucket(self.bucket)
+            clean_and_delete_bucket_by_prefix(OSS_BUCKET + "-test-")
 
     def random_key(self, suffix=''):
         key = self.prefix + random_string(12) + suffix
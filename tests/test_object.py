@@ -5,6 +5,9 @@ import filecmp
 import calendar
 import json
 import base64
+import hashlib
+import shutil
+from mock import patch
 
 from oss2.exceptions import (ClientError, RequestError, NoSuchBucket, OpenApiServerError,
         NotFound, NoSuchKey, Conflict, PositionNotEqualToLength, ObjectNotAppendable)
@@ -21,10 +24,70 @@ def now():
     return int(calendar.timegm(time.gmtime()))
 
 
+# 大部分用例只需要覆盖分块/进度等逻辑，128KB已经足够；需要用大数据测试时可以设置OSS_TEST_LARGE
+SMALL = 128 * 1024
+LARGE = int(os.getenv('OSS_TEST_LARGE', SMALL))
+
+
+# 预先生成一块随机内容（小写字母，与random_bytes一致），各用例从中截取，避免逐字节调用random.choice
+_RANDOM_TABLE = bytes(bytearray(ord('a') + i % 26 for i in range(256)))
+_POOL = os.urandom(max(4 * 1024 * 1024, 2 * LARGE + 1)).translate(_RANDOM_TABLE)
+
+
+def random_bytes_cached(n):
+    if n > len(_POOL):
+        return random_bytes(n)
+
+    offset = random.randint(0, len(_POOL) - n)
+    return _POOL[offset:offset+n]
+
+
+# 用例中复用的请求头部；SDK会复制传入的headers，因此可以安全地共享
+GZIP_HEADERS = {'Accept-Encoding': 'gzip'}
+USER_META = {'x-oss-meta-key1': 'value1', 'X-Oss-Meta-Key2': 'value2'}
+
+
+# 直接访问签名URL时复用同一个连接池，避免每次请求都重新建立连接
+_SESSION = requests.Session()
+_SESSION.mount('http://', requests.adapters.HTTPAdapter(pool_connections=16, pool_maxsize=16, max_retries=0))
+_SESSION.mount('https://', requests.adapters.HTTPAdapter(pool_connections=16, pool_maxsize=16, max_retries=0))
+
+
+def _wait_acl(predicate, timeout=10.0, interval=0.1):
+    """轮询直到predicate()为真，即ACL修改已生效；期间的AccessDenied视为尚未生效。"""
+    end = time.time() + timeout
+    while time.time() < end:
+        try:
+            if predicate():
+                return
+        except oss2.exceptions.AccessDenied:
+            pass
+
+        time.sleep(interval)
+
+    raise AssertionError('acl not propagated in {0} seconds'.format(timeout))
+
+
 class TestObject(OssTestCase):
+    SHARED_BUCKET = True
+
+    @classmethod
+    def setUpClass(cls):
+        # 所有用例都使用随机的key，因此只需创建一次bucket
+        cls.shared_bucket = oss2.Bucket(oss2.Auth(OSS_ID, OSS_SECRET), OSS_ENDPOINT, OSS_BUCKET)
+        try:
+            cls.shared_bucket.create_bucket()
+        except:
+            pass
+
+    @classmethod
+    def tearDownClass(cls):
+        clean_and_delete_bucket(cls.shared_bucket)
+        clean_and_delete_bucket_by_prefix(OSS_BUCKET + "-test-")
+
     def test_object(self):
         key = self.random_key('.js')
-        content = random_bytes(1024)
+        content = random_bytes_cached(1024)
 
         self.assertRaises(NotFound, self.bucket.head_object, key)
 
@@ -139,7 +202,7 @@ class TestObject(OssTestCase):
 
     def test_last_modified_time(self):
         key = self.random_key()
-        content = random_bytes(10)
+        content = random_bytes_cached(10)
 
         self.bucket.put_object(key, content)
 
@@ -151,11 +214,14 @@ class TestObject(OssTestCase):
         self.assertEqual(oss2.utils.to_unixtime(time_string, '%a, %d %b %Y %H:%M:%S GMT'), res.last_modified)
 
     def test_file(self):
-        filename = random_string(12) + '.js'
-        filename2 = random_string(12)
+        tmpdir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, tmpdir, True)
+
+        filename = os.path.join(tmpdir, random_string(12) + '.js')
+        filename2 = os.path.join(tmpdir, random_string(12))
 
         key = self.random_key('.txt')
-        content = random_bytes(1024 * 1024)
+        content = random_bytes_cached(LARGE)
 
         with open(filename, 'wb') as f:
             f.write(content)
@@ -163,14 +229,15 @@ class TestObject(OssTestCase):
         # 上传本地文件到OSS
         self.bucket.put_object_from_file(key, filename)
 
-        # 检查Content-Type应该是javascript
+        # 检查Content-Type应该是javascript，普通上传的ETag即内容的MD5
         result = self.bucket.head_object(key)
         self.assertEqual(result.headers['content-type'], 'application/javascript')
+        self.assertEqual(result.etag.lower(), hashlib.md5(content).hexdigest())
 
-        # 下载到本地文件
+        # 下载到本地文件，直接与内存中的内容比较
         get_result = self.bucket.get_object_to_file(key, filename2)
 
-        self.assertTrue(filecmp.cmp(filename, filename2))
+        self.assertFileContent(filename2, content)
 
         # 上传本地文件的一部分到OSS
         key_partial = self.random_key('-partial.txt')
@@ -184,10 +251,6 @@ class TestObject(OssTestCase):
         self.assertEqual(result.content_length, len(content) - offset)
         self.assertEqual(result.read(), content[offset:])
 
-        # 清理
-        os.remove(filename)
-        os.remove(filename2)
-
     def test_object_empty(self):
         key = self.random_key()
         content = b''
@@ -219,7 +282,7 @@ class TestObject(OssTestCase):
         src_key = self.random_key('.src')
         dst_key = self.random_key('.dst')
 
-        content = random_bytes(1024 * 1024)
+        content = random_bytes_cached(LARGE)
 
         self.bucket.put_object(src_key, content)
 
@@ -235,11 +298,14 @@ class TestObject(OssTestCase):
         self.assertEqual(self.bucket.get_object(src_key).read(), self.bucket.get_object(dst_key).read())
 
     def make_generator(self, content, chunk_size):
+        # 在memoryview上切片不会复制数据；urllib3分块发送和crc计算需要bytes，所以每块只在yield时复制一次
+        view = memoryview(content)
+
         def generator():
             offset = 0
-            while offset < len(content):
-                n = min(chunk_size, len(content) - offset)
-                yield content[offset:offset+n]
+            while offset < len(view):
+                n = min(chunk_size, len(view) - offset)
+                yield view[offset:offset+n].tobytes()
 
                 offset += n
 
@@ -248,9 +314,9 @@ class TestObject(OssTestCase):
     def test_data_generator(self):
         key = self.random_key()
         key2 = self.random_key()
-        content = random_bytes(1024 * 1024 + 1)
+        content = random_bytes_cached(LARGE + 1)
 
-        self.bucket.put_object(key, self.make_generator(content, 8192))
+        self.bucket.put_object(key, self.make_generator(content, 256 * 1024))
         self.assertEqual(self.bucket.get_object(key).read(), content)
 
         # test progress
@@ -262,16 +328,21 @@ class TestObject(OssTestCase):
 
             stats['previous'] = bytes_consumed
 
+        # 使用较小的分块，覆盖多次回调进度的情况
         self.bucket.put_object(key2, self.make_generator(content, 8192), progress_callback=progress_callback)
-        self.assertEqual(self.bucket.get_object(key).read(), content)
+        self.assertEqual(self.bucket.get_object(key2).read(), content)
 
     def test_request_error(self):
         bad_endpoint = random_string(8) + '.' + random_string(16) + '.com'
         bucket = oss2.Bucket(oss2.Auth(OSS_ID, OSS_SECRET), bad_endpoint, OSS_BUCKET)
 
+        # 模拟域名解析失败，无需真正等待DNS查询超时
+        error = requests.exceptions.ConnectionError('Failed to resolve ' + bad_endpoint)
         try:
-            bucket.get_bucket_acl()
+            with patch.object(requests.Session, 'request', side_effect=error):
+                bucket.get_bucket_acl()
         except RequestError as e:
+            self.assertTrue(e.exception is error)
             self.assertEqual(e.status, oss2.exceptions.OSS_REQUEST_ERROR_STATUS)
             self.assertEqual(e.request_id, '')
             self.assertEqual(e.code, '')
@@ -283,7 +354,11 @@ class TestObject(OssTestCase):
     def test_timeout(self):
         bucket = oss2.Bucket(oss2.Auth(OSS_ID, OSS_SECRET), OSS_ENDPOINT, OSS_BUCKET,
                              connect_timeout=0.001)
-        self.assertRaises(RequestError, bucket.get_bucket_acl)
+
+        # 模拟连接超时，并确认connect_timeout被传递给了requests
+        with patch.object(requests.Session, 'request', side_effect=requests.exceptions.ConnectTimeout()) as request:
+            self.assertRaises(RequestError, bucket.get_bucket_acl)
+            self.assertEqual(request.call_args[1]['timeout'], 0.001)
 
     def test_default_timeout(self):
         oss2.defaults.connect_timeout = 0.001
@@ -293,30 +368,24 @@ class TestObject(OssTestCase):
 
     def test_get_object_iterator(self):
         key = self.random_key()
-        content = random_bytes(1024 * 1024)
+        content = random_bytes_cached(LARGE)
 
         self.bucket.put_object(key, content)
         result = self.bucket.get_object(key)
-        content_got = b''
-
-        for chunk in result:
-            content_got += oss2.to_bytes(chunk)
+        content_got = b''.join(oss2.to_bytes(chunk) for chunk in result)
 
         self.assertEqual(len(content), len(content_got))
         self.assertEqual(content, content_got)
 
         result = self.bucket.get_object(key)
-        content_got = b''
-
-        for chunk in result:
-            content_got += chunk
+        content_got = b''.join(result)
 
         self.assertEqual(len(content), len(content_got))
         self.assertEqual(content, content_got)
 
     def test_query_parameter(self):
         key = self.random_key()
-        content = random_bytes(1024 * 1024)
+        content = random_bytes_cached(1024 * 1024)
         self.bucket.put_object(key, content, headers={'Content-Type': 'plain/text'})
         query_params = {'response-content-type': 'image/jpeg'}
         result = self.bucket.get_object(key, params=query_params)
@@ -324,32 +393,45 @@ class TestObject(OssTestCase):
 
     def test_anonymous(self):
         key = self.random_key()
-        content = random_bytes(512)
+        content = random_bytes_cached(512)
 
-        # 设置bucket为public-read，并确认可以上传和下载
-        self.bucket.put_bucket_acl('public-read-write')
-        wait_meta_sync()
+        # bucket在用例之间共享，结束时需要恢复原来的ACL
+        acl = self.bucket.get_bucket_acl().acl
 
-        b = oss2.Bucket(oss2.AnonymousAuth(), OSS_ENDPOINT, OSS_BUCKET)
-        b.put_object(key, content)
-        result = b.get_object(key)
-        self.assertEqual(result.read(), content)
+        try:
+            # 设置bucket为public-read，并确认可以上传和下载
+            self.bucket.put_bucket_acl('public-read-write')
 
-        # 测试sign_url
-        url = b.sign_url('GET', key, 100, params={'para1':'test'})
-        resp = requests.get(url)
-        self.assertEqual(content, resp.content)
+            b = oss2.Bucket(oss2.AnonymousAuth(), OSS_ENDPOINT, OSS_BUCKET)
+            _wait_acl(lambda: b.put_object(key, content).status == 200)
+            result = b.get_object(key)
+            self.assertEqual(result.read(), content)
 
-        # 设置bucket为private，并确认上传和下载都会失败
-        self.bucket.put_bucket_acl('private')
-        wait_meta_sync()
+            # 测试sign_url
+            url = b.sign_url('GET', key, 100, params={'para1':'test'})
+            resp = _SESSION.get(url)
+            self.assertEqual(content, resp.content)
+
+            # 设置bucket为private，并确认上传和下载都会失败
+            self.bucket.put_bucket_acl('private')
 
-        self.assertRaises(oss2.exceptions.AccessDenied, b.put_object, key, content)
-        self.assertRaises(oss2.exceptions.AccessDenied, b.get_object, key)
+            def anonymous_denied():
+                try:
+                    b.get_object(key).read()
+                except oss2.exceptions.AccessDenied:
+                    return True
+                return False
+
+            _wait_acl(anonymous_denied)
+
+            self.assertRaises(oss2.exceptions.AccessDenied, b.put_object, key, content)
+            self.assertRaises(oss2.exceptions.AccessDenied, b.get_object, key)
+        finally:
+            self.bucket.put_bucket_acl(acl)
 
     def test_range_get(self):
         key = self.random_key()
-        content = random_bytes(1024)
+        content = random_bytes_cached(1024)
 
         self.bucket.put_object(key, content)
 
@@ -375,12 +457,8 @@ class TestObject(OssTestCase):
             self.assertTrue(len(obj.owner.display_name) > 0)
 
     def test_batch_delete_objects(self):
-        object_list = []
-        for i in range(0, 5):
-            key = self.random_key()
-            object_list.append(key)
-
-            self.bucket.put_object(key, random_string(64))
+        object_list = [self.random_key() for i in range(0, 5)]
+        put_objects(self.bucket, object_list, lambda key: random_string(64))
 
         result = self.bucket.batch_delete_objects(object_list)
         self.assertEqual(sorted(object_list), sorted(result.deleted_keys))
@@ -408,8 +486,8 @@ class TestObject(OssTestCase):
 
     def test_append_object(self):
         key = self.random_key()
-        content1 = random_bytes(512)
-        content2 = random_bytes(128)
+        content1 = random_bytes_cached(512)
+        content2 = random_bytes_cached(128)
 
         result = self.bucket.append_object(key, 0, content1, init_crc=0)
         self.assertEqual(result.next_position, len(content1))
@@ -430,12 +508,12 @@ class TestObject(OssTestCase):
 
     def test_private_download_url(self):
         for key in [self.random_key(), self.random_key(u'中文文件名')]:
-            content = random_bytes(42)
+            content = random_bytes_cached(42)
 
             self.bucket.put_object(key, content)
             url = self.bucket.sign_url('GET', key, 60)
 
-            resp = requests.get(url)
+            resp = _SESSION.get(url)
             self.assertEqual(content, resp.content)
             
     def test_sign_url_with_callback(self):
@@ -465,7 +543,7 @@ class TestObject(OssTestCase):
         if os.getenv('OSS_TEST_AUTH_VERSION') != oss2.AUTH_VERSION_2:
             return
         key = self.random_key()
-        content = random_bytes(42)
+        content = random_bytes_cached(42)
 
         self.bucket.put_object(key, content)
         url = self.bucket.sign_url('GET', key, 60, params={'extra-query': '1'})
@@ -503,7 +581,7 @@ class TestObject(OssTestCase):
 
     def test_get_object_with_sign_url(self):
         key = self.random_key('.txt')
-        content = random_bytes(100)
+        content = random_bytes_cached(100)
 
         result = self.bucket.put_object(key, content)
         self.assertEqual(result.status, 200)
@@ -530,7 +608,7 @@ class TestObject(OssTestCase):
     def test_put_object_from_file_with_sign_url(self):
         key = self.random_key()
         file_name = self.random_filename()
-        content = random_bytes(100)
+        content = random_bytes_cached(100)
 
         with open(file_name, 'wb') as fw:
             fw.write(content)
@@ -545,7 +623,7 @@ class TestObject(OssTestCase):
     def test_get_object_to_file_with_sign_url(self):
         key = self.random_key('txt')
         file_name = self.random_filename()
-        content = random_bytes(100)
+        content = random_bytes_cached(100)
 
         result = self.bucket.put_object(key, content)
         self.assertEqual(result.status, 200)
@@ -557,7 +635,7 @@ class TestObject(OssTestCase):
     def test_get_object_with_sign_url_slash_safe(self):
         key = 'url下载测试斜杠保护+/二层目录+/测+试斜杠保护.object'
         slash_safe_key = urlquote('url下载测试斜杠保护+') + '/' + urlquote('二层目录+') + '/' + urlquote('测+试斜杠保护.object')
-        content = random_bytes(100)
+        content = random_bytes_cached(100)
 
         result = self.bucket.put_object(key, content)
         self.assertEqual(result.status, 200)
@@ -594,7 +672,7 @@ class TestObject(OssTestCase):
     def test_put_object_with_sign_url_slash_safe(self):
         key = 'url上传测试斜杠保护+/二层目录+/测+试斜杠保护.object'
         slash_safe_key = urlquote('url上传测试斜杠保护+') + '/' + urlquote('二层目录+') + '/' + urlquote('测+试斜杠保护.object')
-        content = random_bytes(1024)
+        content = random_bytes_cached(1024)
 
         # 不带slash_safe 参数
         url = self.bucket.sign_url('PUT', key, 60)
@@ -659,7 +737,7 @@ class TestObject(OssTestCase):
 
     def test_modified_since(self):
         key = self.random_key()
-        content = random_bytes(16)
+        content = random_bytes_cached(16)
 
         self.bucket.put_object(key, content)
         self.assertRaises(oss2.exceptions.NotModified,
@@ -673,7 +751,7 @@ class TestObject(OssTestCase):
     def test_copy_object(self):
         source_key = self.random_key()
         target_key = self.random_key()
-        content = random_bytes(36)
+        content = random_bytes_cached(36)
 
         self.bucket.put_object(source_key, content)
         self.bucket.copy_object(self.bucket.bucket_name, source_key, target_key)
@@ -684,7 +762,7 @@ class TestObject(OssTestCase):
     def test_copy_object_source_with_escape(self):
         source_key = '阿里云/加油/:?;@&=+$, /<>{}[]|/'
         target_key = self.random_key()
-        content = random_bytes(36)
+        content = random_bytes_cached(36)
 
         self.bucket.put_object(source_key, content)
         self.bucket.copy_object(self.bucket.bucket_name, source_key, target_key)
@@ -694,7 +772,7 @@ class TestObject(OssTestCase):
 
     def test_update_object_meta(self):
         key = self.random_key('.txt')
-        content = random_bytes(36)
+        content = random_bytes_cached(36)
 
         self.bucket.put_object(key, content)
 
@@ -707,18 +785,24 @@ class TestObject(OssTestCase):
         self.assertEqual(result.headers['x-oss-meta-category'], 'novel')
 
     def test_object_acl(self):
-        key = self.random_key()
-        content = random_bytes(32)
+        content = random_bytes_cached(32)
+        permissions = (oss2.OBJECT_ACL_PRIVATE, oss2.OBJECT_ACL_PUBLIC_READ, oss2.OBJECT_ACL_PUBLIC_READ_WRITE)
 
-        self.bucket.put_object(key, content)
-        self.assertEqual(self.bucket.get_object_acl(key).acl, oss2.OBJECT_ACL_DEFAULT)
+        # 每种权限使用单独的文件，各自的设置、检查及恢复默认权限并发进行
+        keys = [self.random_key() for permission in permissions]
+        put_objects(self.bucket, keys, lambda key: content)
 
-        for permission in (oss2.OBJECT_ACL_PRIVATE, oss2.OBJECT_ACL_PUBLIC_READ, oss2.OBJECT_ACL_PUBLIC_READ_WRITE,
-                           oss2.OBJECT_ACL_DEFAULT):
-            self.bucket.put_object_acl(key, permission)
-            self.assertEqual(self.bucket.get_object_acl(key).acl, permission)
+        def check_acl(key_and_permission):
+            key, permission = key_and_permission
+            self.assertEqual(self.bucket.get_object_acl(key).acl, oss2.OBJECT_ACL_DEFAULT)
 
-        self.bucket.delete_object(key)
+            for acl in (permission, oss2.OBJECT_ACL_DEFAULT):
+                self.bucket.put_object_acl(key, acl)
+                self.assertEqual(self.bucket.get_object_acl(key).acl, acl)
+
+            self.bucket.delete_object(key)
+
+        run_concurrently(check_acl, list(zip(keys, permissions)), len(keys))
 
     def test_object_exists(self):
         key = self.random_key()
@@ -736,8 +820,7 @@ class TestObject(OssTestCase):
     def test_user_meta(self):
         key = self.random_key()
 
-        self.bucket.put_object(key, 'hello', headers={'x-oss-meta-key1': 'value1',
-                                                      'X-Oss-Meta-Key2': 'value2'})
+        self.bucket.put_object(key, 'hello', headers=USER_META)
 
         headers = self.bucket.get_object(key).headers
         self.assertEqual(headers['x-oss-meta-key1'], 'value1')
@@ -776,7 +859,7 @@ class TestObject(OssTestCase):
             stats['previous'] = bytes_consumed
 
         key = self.random_key()
-        content = random_bytes(2 * 1024 * 1024)
+        content = random_bytes_cached(2 * LARGE)
 
         # 上传内存中的内容
         stats = {'previous': -1}
@@ -796,7 +879,10 @@ class TestObject(OssTestCase):
 
         # 下载到文件
         stats = {'previous': -1}
-        filename = random_string(12) + '.txt'
+        tmpdir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, tmpdir, True)
+
+        filename = os.path.join(tmpdir, random_string(12) + '.txt')
         self.bucket.get_object_to_file(key, filename, progress_callback=progress_callback)
         self.assertEqual(stats['previous'], len(content))
 
@@ -808,17 +894,13 @@ class TestObject(OssTestCase):
         # 下载到本地，采用iterator语法
         stats = {'previous': -1}
         result = self.bucket.get_object(key, progress_callback=progress_callback)
-        content_got = b''
-        for chunk in result:
-            content_got += chunk
+        content_got = b''.join(result)
         self.assertEqual(stats['previous'], len(content))
         self.assertEqual(content, content_got)
 
-        os.remove(filename)
-
     def test_exceptions(self):
         key = self.random_key()
-        content = random_bytes(16)
+        content = random_bytes_cached(16)
 
         self.assertRaises(NotFound, self.bucket.get_object, key)
         self.assertRaises(NoSuchKey, self.bucket.get_object, key)
@@ -832,11 +914,11 @@ class TestObject(OssTestCase):
         #"""OSS supports HTTP Compression, see https://en.wikipedia.org/wiki/HTTP_compression for details.
         #"""
         key = self.random_key('.txt')       # ensure our content-type is text/plain, which could be compressed
-        content = random_bytes(1024 * 1024) # ensure our content-length is larger than 1024 to trigger compression
+        content = random_bytes_cached(max(LARGE, 1024)) # ensure our content-length is larger than 1024 to trigger compression
 
         self.bucket.put_object(key, content)
 
-        result = self.bucket.get_object(key, headers={'Accept-Encoding': 'gzip'})
+        result = self.bucket.get_object(key, headers=GZIP_HEADERS)
         content_read = result.read()
         self.assertEqual(len(content_read), len(content))
         self.assertEqual(content_read, content)
@@ -851,8 +933,7 @@ class TestObject(OssTestCase):
             self.assertTrue(bytes_consumed > stats['previous'])
             stats['previous'] = bytes_consumed
 
-        content_got = b''
-        result = self.bucket.get_object(key, headers={'Accept-Encoding': 'gzip'}, progress_callback=progress_callback)
+        result = self.bucket.get_object(key, headers=GZIP_HEADERS, progress_callback=progress_callback)
         content_got = result.read()
 
         self.assertEqual(len(content), len(content_got))
@@ -860,13 +941,13 @@ class TestObject(OssTestCase):
 
     def test_invalid_object_name(self):
         key = '\invalid-object-name'
-        content = random_bytes(16)
+        content = random_bytes_cached(16)
 
         self.assertRaises(oss2.exceptions.InvalidObjectName, self.bucket.put_object, key, content)
 
     def test_disable_crc(self): 
         key = self.random_key('.txt')
-        content = random_bytes(1024 * 100)
+        content = random_bytes_cached(1024 * 100)
         
         bucket = oss2.Bucket(oss2.Auth(OSS_ID, OSS_SECRET), OSS_ENDPOINT, OSS_BUCKET, enable_crc=False)
         
@@ -907,7 +988,7 @@ class TestObject(OssTestCase):
 
     def test_invalid_crc(self):
         key = self.random_key()
-        content = random_bytes(512)
+        content = random_bytes_cached(512)
 
         try:
             self.bucket.append_object(key, 0, content, init_crc=1)
@@ -1185,8 +1266,8 @@ class TestObject(OssTestCase):
 
     def test_append_object_with_tagging(self):
         key = self.random_key()
-        content1 = random_bytes(512)
-        content2 = random_bytes(128)
+        content1 = random_bytes_cached(512)
+        content2 = random_bytes_cached(128)
 
         result = self.bucket.append_object(key, 0, content1, init_crc=0)
         self.assertEqual(result.next_position, len(content1))
@@ -1238,8 +1319,8 @@ class TestObject(OssTestCase):
 
     def test_append_object_with_tagging_wrong_num(self):
         key = self.random_key()
-        content1 = random_bytes(512)
-        content2 = random_bytes(128)
+        content1 = random_bytes_cached(512)
+        content2 = random_bytes_cached(128)
 
         result = self.bucket.append_object(key, 0, content1, init_crc=0)
         self.assertEqual(result.next_position, len(content1))